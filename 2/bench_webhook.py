@@ -0,0 +1,107 @@
+"""
+webhook 性能基准测试
+
+用法：
+    python bench_webhook.py json                        # 对比 json / orjson 解析和序列化耗时
+    python bench_webhook.py http [URL] [秒数] [并发数]   # 对运行中的服务压测，输出 requests/sec
+
+单核 requests/sec 对比示例（服务和压测客户端分别绑定到不同的核，避免争抢 CPU）：
+    taskset -c 0 python feishu_bot.py &                                   # 或 WEB_CONCURRENCY=1 python server.py feishu_bot:app
+    taskset -c 1 python bench_webhook.py http http://127.0.0.1:8080/webhook 10 64
+客户端与服务共用 CPU 时，结果不能代表每核吞吐。
+"""
+import asyncio
+import json
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 飞书消息事件：外层为 JSON，message.content 又是一层 JSON 字符串
+MESSAGE_EVENT = {
+    "schema": "2.0",
+    "header": {"event_type": "im.message.receive_v1", "event_id": "bench"},
+    "event": {
+        "message": {
+            "chat_id": "oc_bench",
+            "message_type": "text",
+            "content": json.dumps({"text": "北京今天天气怎么样，适合出行吗？"}),
+        }
+    },
+}
+# url_verification 不触发任何外部调用，适合测试服务本身的吞吐
+VERIFICATION_EVENT = {"type": "url_verification", "challenge": "bench"}
+
+
+def _timeit(func, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def bench_json(number: int = 100000):
+    body = json.dumps(MESSAGE_EVENT).encode("utf-8")
+    reply = {"status": "ok", "text": "北京的天气：\n温度：20 °C\n天气：晴"}
+
+    def parse_stdlib():
+        event = json.loads(body)
+        json.loads(event["event"]["message"]["content"])
+
+    def dump_stdlib():
+        json.dumps(reply, ensure_ascii=False).encode("utf-8")
+
+    results = [("json.loads", _timeit(parse_stdlib, number)), ("json.dumps", _timeit(dump_stdlib, number))]
+    if orjson is not None:
+        def parse_orjson():
+            event = orjson.loads(body)
+            orjson.loads(event["event"]["message"]["content"])
+
+        def dump_orjson():
+            orjson.dumps(reply)
+
+        results += [("orjson.loads", _timeit(parse_orjson, number)), ("orjson.dumps", _timeit(dump_orjson, number))]
+    for name, usec in results:
+        print(f"{name:<14}{usec:8.2f} us/次")
+
+
+async def bench_http(url: str, duration: float, concurrency: int):
+    import httpx
+
+    count = 0
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(client_http):
+        nonlocal count, errors
+        while time.perf_counter() < deadline:
+            try:
+                response = await client_http.post(url, json=VERIFICATION_EVENT)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            if response.status_code == 200:
+                count += 1
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client_http:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client_http) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    print(f"{count} 次请求，{errors} 次失败，耗时 {elapsed:.2f} 秒，{count / elapsed:.1f} requests/sec")
+
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else "json"
+    if mode == "json":
+        bench_json()
+    else:
+        url = sys.argv[2] if len(sys.argv) > 2 else "http://127.0.0.1:8080/webhook"
+        duration = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+        concurrency = int(sys.argv[4]) if len(sys.argv) > 4 else 64
+        asyncio.run(bench_http(url, duration, concurrency))
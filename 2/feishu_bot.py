@@ -1,10 +1,10 @@
 from fastapi import FastAPI, Request, HTTPException
 import httpx
-import json
 import os
 from openai import AsyncOpenAI
 import asyncio
-from typing import Optional
+from typing import Optional, Dict, Any
+from json_utils import loads, dumps
 from config import (
     FEISHU_APP_ID,
     FEISHU_APP_SECRET,
@@ -36,10 +36,6 @@ client = AsyncOpenAI(
     ) if proxies or os.getenv("SKIP_VERIFY", "").lower() == "true" else None
 )
 
-# 获取环境变量，用于 Railway 部署
-PORT = int(os.getenv("PORT", 8080))
-HOST = os.getenv("HOST", "0.0.0.0")
-
 # 重试配置
 MAX_RETRIES = 5
 RETRY_DELAY = 2  # 秒
@@ -85,7 +81,7 @@ async def send_feishu_message(token: str, chat_id: str, msg_type: str, content:
     data = {
         "receive_id": chat_id,
         "msg_type": msg_type,
-        "content": json.dumps(msg_content)
+        "content": dumps(msg_content)
     }
     async with httpx.AsyncClient(timeout=30.0) as client_http:
         response = await client_http.post(url, json=data, headers=headers)
@@ -139,7 +135,7 @@ async def process_natural_language(text: str) -> dict:
     ]
     try:
         response_text = await call_openai_with_retry(messages)
-        return json.loads(response_text)
+        return loads(response_text)
     except Exception as e:
         print(f"处理自然语言时出错: {str(e)}")
         return {
@@ -160,7 +156,7 @@ async def analyze_weather_for_outing(weather_data: dict) -> str:
 4. 其他可能影响出行的天气因素
 
 请用简洁友好的语气回复。"""}, 
-        {"role": "user", "content": f"请分析这些天气数据，告诉我是否适合出行：{json.dumps(weather_data, ensure_ascii=False)}"}
+        {"role": "user", "content": f"请分析这些天气数据，告诉我是否适合出行：{dumps(weather_data)}"}
     ]
     try:
         response_text = await call_openai_with_retry(messages, max_tokens=200)
@@ -170,16 +166,16 @@ async def analyze_weather_for_outing(weather_data: dict) -> str:
         return "抱歉，我在分析天气数据时遇到了问题。"
 
 @app.post("/webhook")
-async def handle_webhook(request: Request):
+async def handle_webhook(request: Request) -> Dict[str, Any]:
     try:
-        body = await request.json()
+        body = loads(await request.body())
         if body.get("type") == "url_verification":
             return {"challenge": body.get("challenge")}
         if body.get("header", {}).get("event_type") == "im.message.receive_v1":
             event = body.get("event", {})
             message_type = event.get("message", {}).get("message_type")
             if message_type == "text":
-                content = json.loads(event["message"]["content"])
+                content = loads(event["message"]["content"])
                 text = content.get("text", "").strip()
                 chat_id = event["message"]["chat_id"]
                 token = await get_feishu_token()
@@ -201,8 +197,7 @@ async def handle_webhook(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    import uvicorn
-    print(f"启动服务，监听 {HOST}:{PORT}")
-    uvicorn.run(app, host=HOST, port=PORT)
+    from server import serve
+    serve("feishu_bot:app")
 
 
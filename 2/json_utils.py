@@ -0,0 +1,28 @@
+import json
+from typing import Any
+
+# orjson 是可选依赖：安装后用于请求解析和消息内容序列化，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 取决于运行环境
+    orjson = None
+
+
+def loads(data: Any) -> Any:
+    """
+    解析 JSON，支持 bytes / str
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    序列化为 JSON 字符串，保留中文原样输出（等价于 ensure_ascii=False）
+    """
+    if orjson is not None:
+        # 与标准库一致，允许非字符串的字典键
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
@@ -1,13 +1,11 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
 from typing import Dict, Any
-import uvicorn
-import json
 import re
 
 from mcp_client import MCPClient
 from feishu_bot import FeishuBot
 from config import FEISHU_VERIFICATION_TOKEN
+from json_utils import loads
 
 app = FastAPI()
 mcp_client = MCPClient()
@@ -24,11 +22,11 @@ def is_weather_query(text: str) -> bool:
     return any(keyword in text for keyword in weather_keywords)
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, Any]:
     return {"status": "ok", "message": "Weather Bot is running"}
 
 @app.post("/webhook/feishu")
-async def feishu_webhook(request: Request):
+async def feishu_webhook(request: Request) -> Dict[str, Any]:
     # 验证签名
     event_header = request.headers.get("X-Lark-Request-Timestamp")
     if not event_header:
@@ -36,7 +34,7 @@ async def feishu_webhook(request: Request):
     
     # 获取请求体
     body = await request.body()
-    event = json.loads(body)
+    event = loads(body)
     
     # 处理 URL 验证
     if event.get("type") == "url_verification":
@@ -50,11 +48,11 @@ async def feishu_webhook(request: Request):
         message = event_data.get("message", {})
         
         if message.get("message_type") != "text":
-            return JSONResponse(content={"status": "ok"})
+            return {"status": "ok"}
             
         try:
             # 解析消息内容
-            content = json.loads(message.get("content", "{}"))
+            content = loads(message.get("content", "{}"))
             text = content.get("text", "").strip()
             
             # 判断是否是天气查询
@@ -83,7 +81,8 @@ async def feishu_webhook(request: Request):
         except Exception as e:
             print(f"Error processing message: {str(e)}")
             
-    return JSONResponse(content={"status": "ok"})
+    return {"status": "ok"}
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    from server import serve
+    serve("main:app", default_port=8000)
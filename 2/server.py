@@ -0,0 +1,51 @@
+"""
+生产环境启动入口
+
+用法：
+    python server.py                  # 默认启动 feishu_bot:app
+    python server.py main:app         # 启动其他应用
+
+可通过环境变量配置：
+    HOST / PORT               监听地址和端口
+    WEB_CONCURRENCY           worker 进程数（默认 1）
+    GRACEFUL_TIMEOUT          收到 SIGTERM 后等待进行中请求完成的秒数（默认 30）
+    RELOAD                    设为 true 时开启热重载（仅用于本地开发，强制单进程）
+    ACCESS_LOG                设为 false 时关闭访问日志（默认开启）
+"""
+import os
+import sys
+
+import uvicorn
+
+
+def get_server_options(default_port: int = 8080) -> dict:
+    """
+    根据环境变量生成 uvicorn 启动参数
+    """
+    reload = os.getenv("RELOAD", "").lower() == "true"
+    # 容器内 os.cpu_count() 返回的是宿主机核数，这里与 uvicorn 保持一致默认单进程
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    options = {
+        "host": os.getenv("HOST", "0.0.0.0"),
+        "port": int(os.getenv("PORT", default_port)),
+        # 热重载与多进程互斥
+        "workers": 1 if reload else max(workers, 1),
+        "reload": reload,
+        # 由 uvicorn 自动选择：已安装 uvloop / httptools 时启用，否则回退到 asyncio / h11
+        "loop": "auto",
+        "http": "auto",
+        "timeout_graceful_shutdown": int(os.getenv("GRACEFUL_TIMEOUT", 30)),
+        "access_log": os.getenv("ACCESS_LOG", "").lower() != "false",
+    }
+    return options
+
+
+def serve(app: str = "feishu_bot:app", default_port: int = 8080):
+    options = get_server_options(default_port)
+    print(f"启动服务 {app}，监听 {options['host']}:{options['port']}，workers={options['workers']}")
+    # 多进程模式下必须以 "模块:属性" 字符串形式传入应用
+    uvicorn.run(app, **options)
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1] if len(sys.argv) > 1 else "feishu_bot:app")
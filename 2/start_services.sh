@@ -19,17 +19,22 @@ fi
 # 设置 MCP URL
 export MCP_URL="http://localhost:8000"
 
+# 收到 SIGTERM / Ctrl+C 时转发给子进程，让 uvicorn 完成进行中的请求后再退出
+# trap 必须在 wait 之前设置，否则信号到达时不会被处理
+shutdown() {
+    kill -TERM $BOT_PID $MCP_PID 2>/dev/null
+    wait $BOT_PID $MCP_PID
+    exit 0
+}
+trap shutdown TERM INT
+
 # 启动飞书机器人服务
-python feishu_bot.py &
+python server.py feishu_bot:app &
+BOT_PID=$!
 
 # 启动天气服务
 python weather1.py &
+MCP_PID=$!
 
 # 等待所有后台进程
 wait
-
-# 捕获 Ctrl+C 信号
-trap 'kill $MCP_PID $BOT_PID; exit' INT
-
-# 等待进程结束
-wait 